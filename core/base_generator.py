@@ -1,7 +1,10 @@
 """Base generator class."""
 
+import os
+import multiprocessing
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional
 from pathlib import Path
 from pydantic import BaseModel, Field
 from .schemas import TaskPair
@@ -17,28 +20,102 @@ class GenerationConfig(BaseModel):
     image_size: tuple[int, int] = (400, 400)
 
 
+def _generate_seeded(generator: "BaseGenerator", task_id: str, seed: int) -> TaskPair:
+    """Reseed the generator with a task's own seed, then build that task."""
+    generator.reseed(seed)
+    return generator.generate_task_pair(task_id)
+
+
+# Generator copy owned by a worker process (set once by _init_worker)
+_worker_generator = None
+
+
+def _init_worker(generator: "BaseGenerator") -> None:
+    """Worker initializer: receive the generator once per process, not per chunk."""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _generate_in_worker(task_id: str, seed: int) -> TaskPair:
+    """Worker entry point: build one task with this process's generator copy."""
+    return _generate_seeded(_worker_generator, task_id, seed)
+
+
 class BaseGenerator(ABC):
     """Base class for task generators. Implement generate_task_pair()."""
     
     def __init__(self, config: GenerationConfig):
         self.config = config
         if config.random_seed is not None:
-            import random
-            import numpy as np
-            random.seed(config.random_seed)
-            np.random.seed(config.random_seed)
+            self.reseed(config.random_seed)
+    
+    def reseed(self, seed: int) -> None:
+        """Reseed the random state used for generation. Extend if you keep your own RNG."""
+        import random
+        import numpy as np
+        random.seed(seed)
+        np.random.seed(seed)
     
     @abstractmethod
     def generate_task_pair(self, task_id: str) -> TaskPair:
         """Generate a single task. Implement this in your generator."""
         pass
     
-    def generate_dataset(self) -> List[TaskPair]:
-        """Generate complete dataset."""
+    def task_seeds(self, count: int) -> List[int]:
+        """
+        Spawn one independent seed per task from config.random_seed.
+        
+        Serial and parallel generation both use these, so a seeded dataset is
+        the same no matter how many workers produce it.
+        """
+        import numpy as np
+        
+        return [
+            int(child.generate_state(1)[0])
+            for child in np.random.SeedSequence(self.config.random_seed).spawn(count)
+        ]
+    
+    def generate_batch(self, task_ids: Iterable[str], workers: Optional[int] = None) -> List[TaskPair]:
+        """
+        Generate tasks in parallel across processes.
+        
+        Each task gets its own seed from task_seeds(), so worker processes never
+        share a random stream and the output matches serial generation.
+        Workers are spawned rather than forked, so they never inherit thread
+        pools (e.g. from Numba or OpenCV) that the parent has already started.
+        
+        Args:
+            task_ids: Task IDs to generate
+            workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            Task pairs in the same order as task_ids
+        """
+        task_ids = list(task_ids)
+        workers = workers or os.cpu_count() or 1
+        seeds = self.task_seeds(len(task_ids))
+        chunksize = max(1, len(task_ids) // (workers * 4))
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self,)
+        ) as executor:
+            return list(executor.map(_generate_in_worker, task_ids, seeds, chunksize=chunksize))
+    
+    def generate_dataset(self, workers: Optional[int] = None) -> List[TaskPair]:
+        """Generate complete dataset, in parallel when workers > 1."""
+        task_ids = [f"{self.config.domain}_{i:04d}" for i in range(self.config.num_samples)]
+        if workers is not None and workers > 1:
+            pairs = self.generate_batch(task_ids, workers=workers)
+            for pair in pairs:
+                print(f"  Generated: {pair.task_id}")
+            return pairs
+        
         pairs = []
-        for i in range(self.config.num_samples):
-            task_id = f"{self.config.domain}_{i:04d}"
-            pair = self.generate_task_pair(task_id)
+        for task_id, seed in zip(task_ids, self.task_seeds(len(task_ids))):
+            pair = _generate_seeded(self, task_id, seed)
             pairs.append(pair)
             print(f"  Generated: {task_id}")
         return pairs
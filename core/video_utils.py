@@ -1,11 +1,12 @@
 """Video generation utilities - Generic framework code (DO NOT MODIFY)."""
 
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
 from PIL import Image
 
 # Check if cv2 is available
 import importlib.util
+import itertools
 
 CV2_AVAILABLE = importlib.util.find_spec("cv2") is not None
 
@@ -26,16 +27,23 @@ class VideoGenerator:
     This is a generic utility class - use it in your custom generator.
     """
     
-    def __init__(self, fps: int = 10, output_format: str = "mp4"):
+    # Whether a hardware H.264 writer opened; probed once per process
+    _hw_supported: Optional[bool] = None
+    
+    def __init__(self, fps: int = 10, output_format: str = "mp4", hw_acceleration: bool = False):
         """
         Initialize video generator.
         
         Args:
             fps: Frames per second
             output_format: Video format - "mp4" (recommended) or "avi"
+            hw_acceleration: Try a hardware H.264 encoder (NVENC, QSV,
+                VideoToolbox, ...) for mp4 first, falling back to the
+                software codec when none is available
         """
         self.fps = fps
         self.output_format = output_format
+        self.hw_acceleration = hw_acceleration and output_format == "mp4"
         
         # Use H.264 for mp4 (better compatibility) or XVID for avi
         if output_format == "mp4":
@@ -53,29 +61,78 @@ class VideoGenerator:
         """Check if video generation is available."""
         return CV2_AVAILABLE
     
+    @staticmethod
+    def supports_hw_acceleration() -> bool:
+        """Check if this OpenCV build exposes hardware-accelerated video writing."""
+        return CV2_AVAILABLE and hasattr(cv2, "VIDEOWRITER_PROP_HW_ACCELERATION")
+    
+    def _open_writer(self, output_path: Path, size: Tuple[int, int]):
+        """
+        Open a video writer, preferring a hardware H.264 encoder when enabled.
+        
+        The hardware probe runs once per process (the result is shared by all
+        instances, including unpickled worker copies). OpenCV logging is
+        silenced while probing, so a missing encoder does not print errors;
+        if none opens, every later video goes straight to the software codec.
+        """
+        if self.hw_acceleration and VideoGenerator._hw_supported is not False:
+            if self.supports_hw_acceleration():
+                log_level = cv2.getLogLevel()
+                cv2.setLogLevel(0)  # Silent
+                try:
+                    writer = cv2.VideoWriter(
+                        str(output_path),
+                        cv2.CAP_FFMPEG,
+                        cv2.VideoWriter_fourcc(*'avc1'),
+                        self.fps,
+                        size,
+                        [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+                    )
+                finally:
+                    cv2.setLogLevel(log_level)
+                
+                # Only keep it if an accelerated backend was actually selected
+                if writer.isOpened() and writer.get(cv2.VIDEOWRITER_PROP_HW_ACCELERATION) > 0:
+                    VideoGenerator._hw_supported = True
+                    return writer
+                writer.release()
+            VideoGenerator._hw_supported = False
+        
+        return cv2.VideoWriter(
+            str(output_path),
+            cv2.VideoWriter_fourcc(*self.codec),
+            self.fps,
+            size
+        )
+    
     def create_video_from_frames(
         self,
-        frames: List[Image.Image],
+        frames: Iterable[Image.Image],
         output_path: Path,
         size: Optional[Tuple[int, int]] = None
     ) -> Path:
         """
         Create video from PIL Image frames.
         
+        Frames are written as they are consumed, so a generator can be passed
+        to stream frames without materializing the whole sequence.
+        
         Args:
-            frames: List of PIL Images
+            frames: List or iterable of PIL Images
             output_path: Path to save video (extension will be corrected)
             size: Optional (width, height) tuple. If None, uses first frame size
             
         Returns:
             Path to created video file
         """
-        if not frames:
+        frames = iter(frames)
+        first_frame = next(frames, None)
+        if first_frame is None:
             raise ValueError("No frames provided")
         
         # Get video size
         if size is None:
-            size = frames[0].size
+            size = first_frame.size
         
         width, height = size
         
@@ -85,20 +142,13 @@ class VideoGenerator:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize video writer
-        fourcc = cv2.VideoWriter_fourcc(*self.codec)
-        
-        writer = cv2.VideoWriter(
-            str(output_path),
-            fourcc,
-            self.fps,
-            (width, height)
-        )
+        writer = self._open_writer(output_path, (width, height))
         
         # Write frames
-        for frame in frames:
+        for frame in itertools.chain([first_frame], frames):
             # Ensure RGB and correct size
             if frame.size != size:
-                frame = frame.resize(size, Image.Resampling.LANCZOS)
+                frame = frame.resize(size, Image.LANCZOS)
             
             # Convert PIL Image to OpenCV format (BGR)
             frame_rgb = frame.convert('RGB')
@@ -110,6 +160,67 @@ class VideoGenerator:
         writer.release()
         return output_path
     
+    def create_video_from_arrays(
+        self,
+        frames: Iterable["np.ndarray"],
+        output_path: Path,
+        size: Optional[Tuple[int, int]] = None
+    ) -> Path:
+        """
+        Create video from raw RGB uint8 arrays, skipping PIL entirely.
+        
+        Each array is converted and written as soon as it is consumed, so the
+        producer may reuse one (writeable) buffer for every frame. Consecutive
+        repeats of the same read-only array (e.g. held frames) are converted
+        once and written again from the cached BGR array.
+        
+        Args:
+            frames: List or iterable of (H, W, 3) uint8 RGB arrays
+            output_path: Path to save video (extension will be corrected)
+            size: Optional (width, height) tuple. If None, uses first frame size
+            
+        Returns:
+            Path to created video file
+        """
+        frames = iter(frames)
+        first_frame = next(frames, None)
+        if first_frame is None:
+            raise ValueError("No frames provided")
+        
+        # Get video size
+        if size is None:
+            size = (first_frame.shape[1], first_frame.shape[0])
+        
+        width, height = size
+        
+        # Ensure correct extension
+        output_path = Path(output_path)
+        output_path = output_path.with_suffix(self.extension)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Initialize video writer
+        writer = self._open_writer(output_path, (width, height))
+        
+        # Write frames
+        previous = None
+        frame_bgr = None
+        for frame in itertools.chain([first_frame], frames):
+            # A repeated read-only array cannot have changed - reuse its conversion.
+            # Writeable arrays may be a refilled buffer, so always convert them.
+            if frame is not previous or frame.flags.writeable:
+                previous = frame
+                
+                # Ensure correct size
+                if (frame.shape[1], frame.shape[0]) != size:
+                    frame = cv2.resize(frame, size, interpolation=cv2.INTER_LANCZOS4)
+                
+                frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+            
+            writer.write(frame_bgr)
+        
+        writer.release()
+        return output_path
+    
     def create_crossfade_video(
         self,
         start_image: Image.Image,
@@ -146,7 +257,7 @@ class VideoGenerator:
         
         # Ensure same size
         if start_rgba.size != end_rgba.size:
-            end_rgba = end_rgba.resize(start_rgba.size, Image.Resampling.LANCZOS)
+            end_rgba = end_rgba.resize(start_rgba.size, Image.LANCZOS)
         
         for i in range(transition_frames):
             alpha = i / (transition_frames - 1) if transition_frames > 1 else 1.0
@@ -199,7 +310,7 @@ class VideoGenerator:
         
         # Ensure same size
         if start_rgba.size != end_rgba.size:
-            end_rgba = end_rgba.resize(start_rgba.size, Image.Resampling.LANCZOS)
+            end_rgba = end_rgba.resize(start_rgba.size, Image.LANCZOS)
         
         for i in range(transition_frames):
             # Progress through transition (0 to 1)
@@ -250,7 +361,7 @@ class VideoGenerator:
         
         # Ensure same size and mode
         if start_frame.size != end_frame.size:
-            end_frame = end_frame.resize(start_frame.size, Image.Resampling.LANCZOS)
+            end_frame = end_frame.resize(start_frame.size, Image.LANCZOS)
         
         start_frame = start_frame.convert('RGBA')
         end_frame = end_frame.convert('RGBA')
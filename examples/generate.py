@@ -10,6 +10,7 @@
 Usage:
     python examples/generate.py --num-samples 100
     python examples/generate.py --num-samples 100 --output data/my_task --seed 42
+    python examples/generate.py --num-samples 1000 --workers 8
 """
 
 import argparse
@@ -31,6 +32,7 @@ def main():
 Examples:
     python examples/generate.py --num-samples 10
     python examples/generate.py --num-samples 100 --output data/output --seed 42
+    python examples/generate.py --num-samples 1000 --workers 8
         """
     )
     parser.add_argument(
@@ -56,6 +58,12 @@ Examples:
         action="store_true",
         help="Disable video generation"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Generate tasks in parallel with this many processes (default: serial)"
+    )
     
     args = parser.parse_args()
     
@@ -75,7 +83,7 @@ Examples:
     
     # Generate tasks
     generator = TaskGenerator(config)
-    tasks = generator.generate_dataset()
+    tasks = generator.generate_dataset(workers=args.workers)
     
     # Write to disk
     writer = OutputWriter(Path(args.output))
@@ -47,6 +47,11 @@ class TaskConfig(GenerationConfig):
         description="Video frame rate"
     )
     
+    video_hw_acceleration: bool = Field(
+        default=True,
+        description="Use a hardware H.264 encoder when available (falls back to software)"
+    )
+    
     # ══════════════════════════════════════════════════════════════════════════
     #  TASK-SPECIFIC SETTINGS
     # ══════════════════════════════════════════════════════════════════════════
@@ -7,19 +7,42 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
-import random
 import tempfile
 import math
+import itertools
+import importlib.util
 import numpy as np
 import cv2
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+from typing import Iterator, Optional, Tuple
+from PIL import Image
 
-from core import BaseGenerator, TaskPair, ImageRenderer
+from core import BaseGenerator, TaskPair
 from core.video_utils import VideoGenerator
 from .config import TaskConfig
 from .prompts import get_prompt
 
+# Numba is optional: it fuses the overlap fill into one compiled pass
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+if NUMBA_AVAILABLE:
+    import numba
+    
+    @numba.njit(cache=True)
+    def _fill_overlap(img, y0, y1, x0, x1, cx1, cy1, cx2, cy2, radius_sq, color):
+        """Paint pixels of img[y0:y1, x0:x1] that lie inside both balls."""
+        for y in range(y0, y1):
+            dy1 = (y - cy1) * (y - cy1)
+            dy2 = (y - cy2) * (y - cy2)
+            for x in range(x0, x1):
+                if (dy1 + (x - cx1) * (x - cx1) <= radius_sq and
+                        dy2 + (x - cx2) * (x - cx2) <= radius_sq):
+                    img[y, x, 0] = color[0]
+                    img[y, x, 1] = color[1]
+                    img[y, x, 2] = color[2]
+else:
+    numba = None
+
 
 class TaskGenerator(BaseGenerator):
     """
@@ -31,12 +54,37 @@ class TaskGenerator(BaseGenerator):
     
     def __init__(self, config: TaskConfig):
         super().__init__(config)
-        self.renderer = ImageRenderer(image_size=config.image_size)
         
         # Initialize video generator if enabled (using mp4 format)
         self.video_generator = None
         if config.generate_videos and VideoGenerator.is_available():
-            self.video_generator = VideoGenerator(fps=config.video_fps, output_format="mp4")
+            self.video_generator = VideoGenerator(
+                fps=config.video_fps,
+                output_format="mp4",
+                hw_acceleration=config.video_hw_acceleration
+            )
+        
+        # Per-generator random stream (seeded from config for reproducibility)
+        self._rng = np.random.default_rng(config.random_seed)
+        
+        # Config values read in the per-frame loop, as plain attributes
+        self._width, self._height = config.image_size
+        self._radius = config.ball_radius
+        
+        # Coordinate grids for per-pixel overlap masks (built once per image size)
+        self._yy, self._xx = np.ogrid[:self._height, :self._width]
+        
+        # Squared distance thresholds for the per-frame ball tests
+        self._radius_sq = self._radius ** 2
+        self._four_r2 = (2 * self._radius) ** 2
+        
+        # Reusable RGB buffer for transition frames (reset to white each frame)
+        self._frame_buf = np.empty((self._height, self._width, 3), dtype=np.uint8)
+    
+    def reseed(self, seed: int) -> None:
+        """Reseed the global RNGs and this generator's own random stream."""
+        super().reseed(seed)
+        self._rng = np.random.default_rng(seed)
     
     def generate_task_pair(self, task_id: str) -> TaskPair:
         """Generate one task pair."""
@@ -76,42 +124,12 @@ class TaskGenerator(BaseGenerator):
         width, height = self.config.image_size
         
         # Generate two random colors (RGB)
-        color1 = (
-            random.randint(50, 255),
-            random.randint(50, 255),
-            random.randint(50, 255)
-        )
-        color2 = (
-            random.randint(50, 255),
-            random.randint(50, 255),
-            random.randint(50, 255)
-        )
-        
-        # Calculate subtractive color mixing with normalization
-        # First add the colors (as in additive mixing)
-        additive_r = color1[0] + color2[0]
-        additive_g = color1[1] + color2[1]
-        additive_b = color1[2] + color2[2]
+        colors = self._rng.integers(50, 255, size=(2, 3), endpoint=True)
+        color1 = tuple(int(c) for c in colors[0])
+        color2 = tuple(int(c) for c in colors[1])
         
-        # Normalize if any channel exceeds 255
-        max_value = max(additive_r, additive_g, additive_b)
-        if max_value > 255:
-            # Scale all channels proportionally to keep the color relationship
-            scale = 255.0 / max_value
-            normalized_r = int(additive_r * scale)
-            normalized_g = int(additive_g * scale)
-            normalized_b = int(additive_b * scale)
-        else:
-            normalized_r = int(additive_r)
-            normalized_g = int(additive_g)
-            normalized_b = int(additive_b)
-        
-        # Apply subtractive mixing: subtract from 255
-        mixed_r = 255 - normalized_r
-        mixed_g = 255 - normalized_g
-        mixed_b = 255 - normalized_b
-        
-        mixed_color = (mixed_r, mixed_g, mixed_b)
+        # Subtractive mixture, computed once per task; the animation reuses it
+        mixed_color = self._mix_subtractive(color1, color2)
         
         # Generate two ball positions that don't overlap
         # Ensure balls are fully visible and have minimum distance
@@ -119,29 +137,41 @@ class TaskGenerator(BaseGenerator):
         radius = self.config.ball_radius
         min_dist = self.config.min_distance
         
-        # Try to find valid positions
-        for _ in range(100):  # Try up to 100 times
-            x1 = random.randint(margin, width - margin)
-            y1 = random.randint(margin, height - margin)
-            x2 = random.randint(margin, width - margin)
-            y2 = random.randint(margin, height - margin)
+        # Sample the meeting point directly, then a direction and a separation
+        # that keeps both balls in bounds - every draw is valid, no rejection.
+        # The midpoint box leaves min_dist / 2 of slack on each axis, which
+        # guarantees that a separation of min_dist fits in any direction.
+        half_min = min_dist / 2
+        if width - 2 * margin >= min_dist and height - 2 * margin >= min_dist:
+            mid_x = float(self._rng.uniform(margin + half_min, width - margin - half_min))
+            mid_y = float(self._rng.uniform(margin + half_min, height - margin - half_min))
+            theta = float(self._rng.uniform(0.0, 2 * math.pi))
+            cos_t, sin_t = math.cos(theta), math.sin(theta)
             
-            # Check distance
-            distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-            if distance >= min_dist:
-                # Calculate midpoint (where they will meet)
-                mid_x = (x1 + x2) / 2
-                mid_y = (y1 + y2) / 2
-                
-                return {
-                    "color1": color1,
-                    "color2": color2,
-                    "mixed_color": mixed_color,
-                    "ball1_pos": (x1, y1),
-                    "ball2_pos": (x2, y2),
-                    "final_pos": (mid_x, mid_y),
-                    "type": "default"
-                }
+            # Largest half-separation allowed by each image edge along theta
+            max_half = math.inf
+            slack_x = min(mid_x - margin, width - margin - mid_x)
+            slack_y = min(mid_y - margin, height - margin - mid_y)
+            if abs(cos_t) > 1e-12:
+                max_half = min(max_half, slack_x / abs(cos_t))
+            if abs(sin_t) > 1e-12:
+                max_half = min(max_half, slack_y / abs(sin_t))
+            
+            half_dist = float(self._rng.uniform(half_min, max_half))
+            x1 = mid_x + half_dist * cos_t
+            y1 = mid_y + half_dist * sin_t
+            x2 = mid_x - half_dist * cos_t
+            y2 = mid_y - half_dist * sin_t
+            
+            return {
+                "color1": color1,
+                "color2": color2,
+                "mixed_color": mixed_color,
+                "ball1_pos": (x1, y1),
+                "ball2_pos": (x2, y2),
+                "final_pos": (mid_x, mid_y),
+                "type": "default"
+            }
         
         # Fallback: use default positions if we can't find valid ones
         x1 = width // 4
@@ -161,56 +191,68 @@ class TaskGenerator(BaseGenerator):
             "type": "default"
         }
     
+    @staticmethod
+    def _mix_subtractive(color1: tuple, color2: tuple) -> tuple:
+        """Subtractive mixture of two RGB colors: 255 minus the normalized additive sum."""
+        # Calculate subtractive color mixing with normalization
+        # First add the colors (as in additive mixing)
+        additive_r = color1[0] + color2[0]
+        additive_g = color1[1] + color2[1]
+        additive_b = color1[2] + color2[2]
+        
+        # Normalize if any channel exceeds 255
+        max_value = max(additive_r, additive_g, additive_b)
+        if max_value > 255:
+            # Scale all channels proportionally to keep the color relationship
+            scale = 255.0 / max_value
+            normalized_r = int(additive_r * scale)
+            normalized_g = int(additive_g * scale)
+            normalized_b = int(additive_b * scale)
+        else:
+            normalized_r = int(additive_r)
+            normalized_g = int(additive_g)
+            normalized_b = int(additive_b)
+        
+        # Apply subtractive mixing: subtract from 255
+        mixed_r = 255 - normalized_r
+        mixed_g = 255 - normalized_g
+        mixed_b = 255 - normalized_b
+        
+        return (mixed_r, mixed_g, mixed_b)
+    
     def _render_initial_state(self, task_data: dict) -> Image.Image:
         """Render initial state: two colored balls at different positions."""
-        img = self.renderer.create_blank_image(bg_color=(255, 255, 255))
-        draw = ImageDraw.Draw(img)
+        img_array = np.full((self._height, self._width, 3), 255, dtype=np.uint8)
         
-        radius = self.config.ball_radius
+        radius = self._radius
         ball1_pos = task_data["ball1_pos"]
         ball2_pos = task_data["ball2_pos"]
-        color1 = task_data["color1"]
-        color2 = task_data["color2"]
+        center1 = (int(ball1_pos[0]), int(ball1_pos[1]))
+        center2 = (int(ball2_pos[0]), int(ball2_pos[1]))
         
         # Draw ball 1
-        bbox1 = (
-            ball1_pos[0] - radius,
-            ball1_pos[1] - radius,
-            ball1_pos[0] + radius,
-            ball1_pos[1] + radius
-        )
-        draw.ellipse(bbox1, fill=color1, outline=(0, 0, 0), width=2)
+        cv2.circle(img_array, center1, radius, task_data["color1"], -1, cv2.LINE_AA)
+        cv2.circle(img_array, center1, radius, (0, 0, 0), 2, cv2.LINE_AA)
         
         # Draw ball 2
-        bbox2 = (
-            ball2_pos[0] - radius,
-            ball2_pos[1] - radius,
-            ball2_pos[0] + radius,
-            ball2_pos[1] + radius
-        )
-        draw.ellipse(bbox2, fill=color2, outline=(0, 0, 0), width=2)
+        cv2.circle(img_array, center2, radius, task_data["color2"], -1, cv2.LINE_AA)
+        cv2.circle(img_array, center2, radius, (0, 0, 0), 2, cv2.LINE_AA)
         
-        return img
+        return Image.fromarray(img_array, 'RGB')
     
     def _render_final_state(self, task_data: dict) -> Image.Image:
         """Render final state: two balls overlapped at midpoint with mixed color."""
-        img = self.renderer.create_blank_image(bg_color=(255, 255, 255))
-        draw = ImageDraw.Draw(img)
+        img_array = np.full((self._height, self._width, 3), 255, dtype=np.uint8)
         
-        radius = self.config.ball_radius
+        radius = self._radius
         final_pos = task_data["final_pos"]
-        mixed_color = task_data["mixed_color"]
+        center = (int(final_pos[0]), int(final_pos[1]))
         
         # Draw the overlapped ball at the midpoint with mixed color
-        bbox = (
-            final_pos[0] - radius,
-            final_pos[1] - radius,
-            final_pos[0] + radius,
-            final_pos[1] + radius
-        )
-        draw.ellipse(bbox, fill=mixed_color, outline=(0, 0, 0), width=2)
+        cv2.circle(img_array, center, radius, task_data["mixed_color"], -1, cv2.LINE_AA)
+        cv2.circle(img_array, center, radius, (0, 0, 0), 2, cv2.LINE_AA)
         
-        return img
+        return Image.fromarray(img_array, 'RGB')
     
     def _generate_video(
         self,
@@ -224,39 +266,58 @@ class TaskGenerator(BaseGenerator):
         temp_dir.mkdir(parents=True, exist_ok=True)
         video_path = temp_dir / f"{task_id}_ground_truth.mp4"
         
-        # Create animation frames
-        frames = self._create_mixing_animation_frames(task_data)
+        # Stream raw RGB animation frames straight into the encoder,
+        # reusing the endpoint images already rendered for the task pair
+        frames = self._stream_mixing_animation_frames(
+            task_data,
+            first_image=first_image,
+            final_image=final_image
+        )
         
-        result = self.video_generator.create_video_from_frames(
+        result = self.video_generator.create_video_from_arrays(
             frames,
             video_path
         )
         
         return str(result) if result else None
     
-    def _create_mixing_animation_frames(
+    def _stream_mixing_animation_frames(
         self,
         task_data: dict,
         hold_frames: int = 5,
-        transition_frames: int = 25
-    ) -> list:
+        transition_frames: int = 25,
+        first_image: Optional[Image.Image] = None,
+        final_image: Optional[Image.Image] = None
+    ) -> Iterator[np.ndarray]:
         """
-        Create animation frames showing two balls moving toward each other and mixing.
+        Yield animation frames showing two balls moving toward each other and mixing.
+        
+        Streaming only: frames are (H, W, 3) uint8 RGB arrays produced lazily
+        for an encoder that consumes each one before asking for the next.
+        Transition frames are all the same reused buffer, so materializing the
+        generator (e.g. list(...)) aliases them - copy each frame to keep it.
+        Held endpoint frames repeat one read-only array built from
+        first_image / final_image when given, otherwise they are rendered.
         
         The animation shows:
         1. Initial state: two balls at different positions
         2. Transition: balls moving toward each other at same speed
         3. Final state: balls overlapped at midpoint with subtractive mixed color
         """
-        frames = []
-        
-        # Hold initial position
-        first_frame = self._render_initial_state(task_data)
-        for _ in range(hold_frames):
-            frames.append(first_frame)
-        
-        # Create transition frames
-        radius = self.config.ball_radius
+        # Hold initial position (one read-only array, repeated)
+        if first_image is None:
+            first_image = self._render_initial_state(task_data)
+        first_array = np.asarray(first_image)
+        first_array.flags.writeable = False
+        yield from itertools.repeat(first_array, hold_frames)
+        
+        # Create transition frames (hot-loop values bound to locals)
+        width, height = self._width, self._height
+        radius = self._radius
+        radius_sq = self._radius_sq
+        img_array = self._frame_buf
+        blit_stamp = self._blit_stamp
+        xx, yy = self._xx, self._yy
         ball1_start = task_data["ball1_pos"]
         ball2_start = task_data["ball2_pos"]
         final_pos = task_data["final_pos"]
@@ -264,180 +325,144 @@ class TaskGenerator(BaseGenerator):
         color2 = task_data["color2"]
         mixed_color = task_data["mixed_color"]
         
+        # Pre-rendered ball sprites for frames where the balls are apart
+        stamp1 = self._make_ball_stamp(color1)
+        stamp2 = self._make_ball_stamp(color2)
+        
+        # Interpolate every frame's ball centers at once (linear motion)
+        if transition_frames > 1:
+            progresses = np.linspace(0.0, 1.0, transition_frames)[:, None]
+        else:
+            progresses = np.ones((1, 1))
+        target = np.asarray(final_pos, dtype=np.float64)
+        start1 = np.asarray(ball1_start, dtype=np.float64)
+        start2 = np.asarray(ball2_start, dtype=np.float64)
+        pos1 = start1 + (target - start1) * progresses
+        pos2 = start2 + (target - start2) * progresses
+        
+        # Integer pixel centers and the per-frame overlap test (squared distance)
+        centers1 = pos1.astype(np.int64).tolist()
+        centers2 = pos2.astype(np.int64).tolist()
+        overlapping = (((pos2 - pos1) ** 2).sum(axis=1) < self._four_r2).tolist()
+        
         for i in range(transition_frames):
-            progress = i / (transition_frames - 1) if transition_frames > 1 else 1.0
+            # Create frame with animated balls (cv2 draws color tuples as given,
+            # so the buffer stays in RGB order). One buffer serves every frame.
+            img_array.fill(255)
             
-            # Create frame with animated balls
-            img = self.renderer.create_blank_image(bg_color=(255, 255, 255))
-            draw = ImageDraw.Draw(img)
+            center1 = tuple(centers1[i])
+            center2 = tuple(centers2[i])
             
-            # Calculate current positions (linear interpolation)
-            ball1_current = (
-                ball1_start[0] + (final_pos[0] - ball1_start[0]) * progress,
-                ball1_start[1] + (final_pos[1] - ball1_start[1]) * progress
-            )
-            ball2_current = (
-                ball2_start[0] + (final_pos[0] - ball2_start[0]) * progress,
-                ball2_start[1] + (final_pos[1] - ball2_start[1]) * progress
-            )
+            if not overlapping[i]:
+                # Draw both balls separately (no overlap)
+                blit_stamp(img_array, stamp1, center1)
+                blit_stamp(img_array, stamp2, center2)
+                yield img_array
+                continue
             
-            # Calculate distance between ball centers
-            distance = math.sqrt(
-                (ball2_current[0] - ball1_current[0]) ** 2 +
-                (ball2_current[1] - ball1_current[1]) ** 2
-            )
+            # Fill both balls
+            cv2.circle(img_array, center1, radius, color1, -1, cv2.LINE_AA)
+            cv2.circle(img_array, center2, radius, color2, -1, cv2.LINE_AA)
             
-            # Draw balls with proper overlap handling
-            if distance < 2 * radius:
-                # Balls are overlapping - need to draw with mixed color only in overlap region
-                # Use numpy for efficient pixel operations
-                
-                width, height = self.config.image_size
-                img_array = np.ones((height, width, 3), dtype=np.uint8) * 255
-                
-                # Create coordinate grids
-                y_coords, x_coords = np.ogrid[:height, :width]
-                
-                # Calculate distances from each ball center
-                dist1 = np.sqrt((x_coords - ball1_current[0]) ** 2 + (y_coords - ball1_current[1]) ** 2)
-                dist2 = np.sqrt((x_coords - ball2_current[0]) ** 2 + (y_coords - ball2_current[1]) ** 2)
-                
-                # Create masks
-                ball1_mask = dist1 <= radius
-                ball2_mask = dist2 <= radius
-                overlap_mask = ball1_mask & ball2_mask
-                ball1_only_mask = ball1_mask & ~overlap_mask
-                ball2_only_mask = ball2_mask & ~overlap_mask
-                
-                # Draw ball1 (non-overlap parts)
-                img_array[ball1_only_mask] = color1
-                
-                # Draw ball2 (non-overlap parts)
-                img_array[ball2_only_mask] = color2
-                
-                # Draw overlap region with normalized subtractive color mixing
-                # First calculate additive mixing (as in additive mixing)
-                overlap_additive_r = np.zeros((height, width), dtype=np.float32)
-                overlap_additive_g = np.zeros((height, width), dtype=np.float32)
-                overlap_additive_b = np.zeros((height, width), dtype=np.float32)
-                
-                # Add colors in overlap region
-                overlap_additive_r[overlap_mask] = color1[0] + color2[0]
-                overlap_additive_g[overlap_mask] = color1[1] + color2[1]
-                overlap_additive_b[overlap_mask] = color1[2] + color2[2]
-                
-                # Normalize: find max value per pixel and scale if > 255
-                max_per_pixel = np.maximum(np.maximum(overlap_additive_r, overlap_additive_g), overlap_additive_b)
-                scale_mask = max_per_pixel > 255
-                scale_factor = np.ones((height, width), dtype=np.float32)
-                scale_factor[scale_mask] = 255.0 / max_per_pixel[scale_mask]
-                
-                # Apply normalization
-                overlap_normalized_r = (overlap_additive_r * scale_factor).astype(np.uint8)
-                overlap_normalized_g = (overlap_additive_g * scale_factor).astype(np.uint8)
-                overlap_normalized_b = (overlap_additive_b * scale_factor).astype(np.uint8)
-                
-                # Apply subtractive mixing: subtract from 255
-                overlap_mixed_r = 255 - overlap_normalized_r
-                overlap_mixed_g = 255 - overlap_normalized_g
-                overlap_mixed_b = 255 - overlap_normalized_b
-                
-                # Combine into RGB image
-                img_array[overlap_mask, 0] = overlap_mixed_r[overlap_mask]
-                img_array[overlap_mask, 1] = overlap_mixed_g[overlap_mask]
-                img_array[overlap_mask, 2] = overlap_mixed_b[overlap_mask]
-                
-                # Convert back to PIL Image
-                img = Image.fromarray(img_array, 'RGB')
-                draw = ImageDraw.Draw(img)
-                
-                # Draw complete black outlines for both balls (always visible, regardless of overlap)
-                bbox1 = (
-                    int(ball1_current[0] - radius),
-                    int(ball1_current[1] - radius),
-                    int(ball1_current[0] + radius),
-                    int(ball1_current[1] + radius)
-                )
-                draw.ellipse(bbox1, outline=(0, 0, 0), width=2)
-                
-                bbox2 = (
-                    int(ball2_current[0] - radius),
-                    int(ball2_current[1] - radius),
-                    int(ball2_current[0] + radius),
-                    int(ball2_current[1] + radius)
+            # Balls are overlapping - recolor only the overlap region.
+            # The lunes are already filled by cv2, so the masks only need
+            # the window where the two balls' bounding boxes intersect.
+            x0 = max(max(center1[0], center2[0]) - radius - 1, 0)
+            x1 = min(min(center1[0], center2[0]) + radius + 2, width)
+            y0 = max(max(center1[1], center2[1]) - radius - 1, 0)
+            y1 = min(min(center1[1], center2[1]) + radius + 2, height)
+            
+            # Draw overlap region with the subtractive mixed color.
+            # Both ball colors are constant across the overlap, so the
+            # mixture is the scalar already computed in task_data.
+            if NUMBA_AVAILABLE:
+                _fill_overlap(
+                    img_array, y0, y1, x0, x1,
+                    center1[0], center1[1], center2[0], center2[1],
+                    radius_sq, mixed_color
                 )
-                draw.ellipse(bbox2, outline=(0, 0, 0), width=2)
             else:
-                # Draw both balls separately (no overlap)
-                bbox1 = (
-                    ball1_current[0] - radius,
-                    ball1_current[1] - radius,
-                    ball1_current[0] + radius,
-                    ball1_current[1] + radius
-                )
-                draw.ellipse(bbox1, fill=color1, outline=(0, 0, 0), width=2)
+                # Squared offsets from each ball center (no sqrt needed against radius**2)
+                dx1 = xx[:, x0:x1] - center1[0]
+                dy1 = yy[y0:y1] - center1[1]
+                dx2 = xx[:, x0:x1] - center2[0]
+                dy2 = yy[y0:y1] - center2[1]
                 
-                bbox2 = (
-                    ball2_current[0] - radius,
-                    ball2_current[1] - radius,
-                    ball2_current[0] + radius,
-                    ball2_current[1] + radius
+                overlap_mask = (
+                    (dx1 * dx1 + dy1 * dy1 <= radius_sq) &
+                    (dx2 * dx2 + dy2 * dy2 <= radius_sq)
                 )
-                draw.ellipse(bbox2, fill=color2, outline=(0, 0, 0), width=2)
+                img_array[y0:y1, x0:x1][overlap_mask] = mixed_color
             
-            frames.append(img)
+            # Outline only the outer arc of each ball; the arcs inside the other
+            # ball would cut through the mixed region. The overlap spans
+            # +/- half_angle around the line joining the centers.
+            gap_x = center2[0] - center1[0]
+            gap_y = center2[1] - center1[1]
+            half_angle = math.degrees(math.acos(min(math.hypot(gap_x, gap_y) / (2 * radius), 1.0)))
+            toward2 = math.degrees(math.atan2(gap_y, gap_x))
+            cv2.ellipse(
+                img_array, center1, (radius, radius), 0,
+                toward2 + half_angle, toward2 + 360 - half_angle,
+                (0, 0, 0), 2, cv2.LINE_AA
+            )
+            cv2.ellipse(
+                img_array, center2, (radius, radius), 0,
+                toward2 + 180 + half_angle, toward2 + 540 - half_angle,
+                (0, 0, 0), 2, cv2.LINE_AA
+            )
+            
+            yield img_array
+        
+        # Hold final position (one read-only array, repeated)
+        if final_image is None:
+            final_image = self._render_final_state(task_data)
+        final_array = np.asarray(final_image)
+        final_array.flags.writeable = False
+        yield from itertools.repeat(final_array, hold_frames)
+    
+    def _make_ball_stamp(self, color: tuple) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pre-render one outlined ball as a sprite for alpha compositing.
         
-        # Hold final position
-        final_frame = self._render_final_state(task_data)
-        for _ in range(hold_frames):
-            frames.append(final_frame)
+        The ball is drawn once on black and once on white; the two renders give
+        the premultiplied color and the per-pixel background weight, so a
+        blitted sprite matches drawing the anti-aliased ball in place. Where
+        two sprite windows overlap, each blend rounds to uint8 separately, so
+        those pixels can differ from direct drawing by 1-2 intensity levels.
         
-        return frames
-    
-    # ══════════════════════════════════════════════════════════════════════════
-    #  HELPER METHODS
-    # ══════════════════════════════════════════════════════════════════════════
-    
-    def _draw_arrow(self, draw: ImageDraw.Draw, start: tuple, end: tuple, 
-                   color: tuple = (0, 0, 0), width: int = 2):
-        """Draw a line with an arrowhead at the end."""
-        # Draw the line
-        draw.line([start, end], fill=color, width=width)
-        
-        # Calculate arrowhead
-        dx = end[0] - start[0]
-        dy = end[1] - start[1]
-        angle = math.atan2(dy, dx)
-        
-        arrow_length = 15
-        arrow_angle = math.pi / 6  # 30 degrees
-        
-        # Arrowhead points
-        arrow1_x = end[0] - arrow_length * math.cos(angle - arrow_angle)
-        arrow1_y = end[1] - arrow_length * math.sin(angle - arrow_angle)
-        arrow2_x = end[0] - arrow_length * math.cos(angle + arrow_angle)
-        arrow2_y = end[1] - arrow_length * math.sin(angle + arrow_angle)
-        
-        # Draw arrowhead
-        draw.line([end, (arrow1_x, arrow1_y)], fill=color, width=width)
-        draw.line([end, (arrow2_x, arrow2_y)], fill=color, width=width)
+        Returns:
+            (premultiplied RGB, background weight) float32 arrays of shape (D, D, 3)
+        """
+        radius = self._radius
+        half = radius + 2
+        center = (half, half)
+        
+        renders = []
+        for background in (0, 255):
+            patch = np.full((2 * half + 1, 2 * half + 1, 3), background, dtype=np.uint8)
+            cv2.circle(patch, center, radius, color, -1, cv2.LINE_AA)
+            cv2.circle(patch, center, radius, (0, 0, 0), 2, cv2.LINE_AA)
+            renders.append(patch.astype(np.float32))
+        on_black, on_white = renders
+        
+        return on_black, (on_white - on_black) / 255.0
     
-    def _get_font(self, size: int = 20) -> ImageFont.FreeTypeFont:
-        """Get a font for rendering text."""
-        # Try common fonts
-        font_names = [
-            "Arial.ttf",
-            "/System/Library/Fonts/Supplemental/Arial.ttf",
-            "/Library/Fonts/Arial.ttf",
-            "DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        ]
-        
-        for font_name in font_names:
-            try:
-                return ImageFont.truetype(font_name, size)
-            except (OSError, IOError):
-                continue
-        
-        # Fallback to default
-        return ImageFont.load_default()
+    @staticmethod
+    def _blit_stamp(img_array: np.ndarray, stamp: Tuple[np.ndarray, np.ndarray], center: tuple):
+        """Alpha-composite a ball stamp onto img_array centered at center (clipped to bounds)."""
+        premultiplied, weight = stamp
+        half = premultiplied.shape[0] // 2
+        height, width = img_array.shape[:2]
+        
+        x0, y0 = center[0] - half, center[1] - half
+        x1, y1 = x0 + premultiplied.shape[1], y0 + premultiplied.shape[0]
+        sx0, sy0 = max(-x0, 0), max(-y0, 0)
+        sx1 = premultiplied.shape[1] - max(x1 - width, 0)
+        sy1 = premultiplied.shape[0] - max(y1 - height, 0)
+        if sx0 >= sx1 or sy0 >= sy1:
+            return
+        
+        patch = img_array[y0 + sy0:y0 + sy1, x0 + sx0:x0 + sx1]
+        blended = premultiplied[sy0:sy1, sx0:sx1] + patch * weight[sy0:sy1, sx0:sx1]
+        patch[:] = (blended + 0.5).astype(np.uint8)